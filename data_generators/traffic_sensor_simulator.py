@@ -3,15 +3,19 @@ Traffic Sensor Simulator
 Generates realistic traffic data for smart city simulation
 """
 
-import json
-import time
-import random
+import asyncio
+import logging
+import orjson
+from queue import Queue
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime, timedelta
-from azure.eventhub import EventHubProducerClient, EventData
-from dataclasses import dataclass, asdict
+from collections import defaultdict
+from azure.eventhub import EventData
+from dataclasses import dataclass, fields
 from typing import List, Tuple
-import math
+import numpy as np
 from utils.config_loader import get_config
+from utils.eventhub_pool import get_producer, release
 
 #import azure.eventhub
 #import azure.core
@@ -19,9 +23,79 @@ from utils.config_loader import get_config
 #print(azure.eventhub.__version__)
 #print(azure.core.__version__)
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 config = get_config()
 
-@dataclass
+logger = logging.getLogger("traffic_simulator")
+
+def _setup_logging() -> QueueListener:
+    """Route log records through a queue so the send loop never blocks on stdout"""
+    log_queue = Queue()
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    logger.setLevel(logging.INFO)
+    logger.addHandler(QueueHandler(log_queue))
+    listener.start()
+    return listener
+
+# District traffic multipliers (shared by scalar and batch generation paths)
+DISTRICT_MULTIPLIERS = {
+    "downtown": 1.5,
+    "residential": 0.7,
+    "industrial": 1.2,
+    "suburban": 0.5
+}
+
+# Array views of the district tables, indexed by district id (distance bands
+# from the city center: <3 downtown, <5 residential, <7 industrial, else suburban)
+DISTRICT_NAME_ARR = np.array(["downtown", "residential", "industrial", "suburban"])
+DISTRICT_MULT_ARR = np.array([1.5, 0.7, 1.2, 0.5])
+DISTRICT_CAMERA_PROB_ARR = np.array([0.8, 0.3, 0.5, 0.2])
+DISTRICT_BOUNDS = [3, 5, 7]
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _compute_batch(base_capacity, district_mult, time_mult, weather_mult,
+                       count_noise, truck_frac, motorcycle_frac, bus_frac,
+                       wait_draw, vehicle_count, occupancy_rate, average_speed,
+                       cars, trucks, motorcycles, buses, wait_time, queue_length):
+        """Fused per-intersection arithmetic for generate_reading_batch
+
+        All random draws happen in NumPy before the call (strings and RNG
+        objects aren't supported inside the kernel); only the numeric core
+        runs under the JIT, one cache-friendly pass per intersection.
+        """
+        n = base_capacity.shape[0]
+        for i in prange(n):
+            vc = int(base_capacity[i] * time_mult[i] * district_mult[i]
+                     * weather_mult[i]) + count_noise[i]
+            if vc < 0:
+                vc = 0
+            occ = vc / (base_capacity[i] * 2)
+            if occ > 1.0:
+                occ = 1.0
+            speed = 35 * (1 - occ * 0.7)
+            if speed < 5:
+                speed = 5.0
+            truck = int(vc * truck_frac[i])
+            motorcycle = int(vc * motorcycle_frac[i])
+            bus = int(vc * bus_frac[i])
+
+            vehicle_count[i] = vc
+            occupancy_rate[i] = occ
+            average_speed[i] = speed
+            trucks[i] = truck
+            motorcycles[i] = motorcycle
+            buses[i] = bus
+            cars[i] = vc - truck - motorcycle - bus
+            wait_time[i] = occ * wait_draw[i]
+            queue_length[i] = int(occ * base_capacity[i] * 0.5)
+
+@dataclass(slots=True)
 class Intersection:
     """Represents a traffic intersection"""
     intersection_id: str
@@ -33,7 +107,11 @@ class Intersection:
     has_camera: bool
     district: str
 
-@dataclass
+    def to_dict(self) -> dict:
+        """Flat dict view; skips the recursive deepcopy in dataclasses.asdict"""
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+@dataclass(slots=True)
 class TrafficReading:
     """Single traffic sensor reading"""
     sensor_id: str
@@ -50,65 +128,91 @@ class TrafficReading:
     longitude: float
     district: str
 
+    def to_dict(self) -> dict:
+        """Flat dict view; skips the recursive deepcopy in dataclasses.asdict"""
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+# Field-name tuples cached once per class so to_dict is a plain dict build
+Intersection._FIELDS = tuple(f.name for f in fields(Intersection))
+TrafficReading._FIELDS = tuple(f.name for f in fields(TrafficReading))
+
 class CityGrid:
     """Generates realistic city intersection grid"""
     
     def __init__(self, city_center: Tuple[float, float], grid_size: int = 10):
         self.city_center = city_center
         self.grid_size = grid_size
-        self.intersections = self._generate_intersections()
-    
-    def _generate_intersections(self) -> List[Intersection]:
-        """Generate grid of intersections"""
-        intersections = []
-        
-        # Districts with different characteristics
-        districts = {
-            "downtown": {"traffic_multiplier": 1.5, "camera_prob": 0.8},
-            "residential": {"traffic_multiplier": 0.7, "camera_prob": 0.3},
-            "industrial": {"traffic_multiplier": 1.2, "camera_prob": 0.5},
-            "suburban": {"traffic_multiplier": 0.5, "camera_prob": 0.2}
-        }
-        
+        self.rng = np.random.default_rng()
+        self._intersections = None
+        self._build_grid_arrays()
+
+    def _build_grid_arrays(self):
+        """Construct the grid as structure-of-arrays in a few vectorized calls
+
+        The Intersection dataclass list is materialized lazily via the
+        `intersections` property; the batch generation path reads these
+        arrays directly.
+        """
+        n = self.grid_size ** 2
         lat_base, lon_base = self.city_center
-        
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                # Offset from center (approx 0.01 degrees = 1.1 km)
-                lat = lat_base + (i - self.grid_size/2) * 0.01
-                lon = lon_base + (j - self.grid_size/2) * 0.01
-                
-                # Determine district based on distance from center
-                distance = math.sqrt(i**2 + j**2)
-                if distance < 3:
-                    district = "downtown"
-                elif distance < 5:
-                    district = "residential"
-                elif distance < 7:
-                    district = "industrial"
-                else:
-                    district = "suburban"
-                
-                district_config = districts[district]
-                
-                intersection = Intersection(
-                    intersection_id=f"INT-{i:02d}{j:02d}",
-                    name=f"{chr(65+i)} St & {j+1} Ave",
-                    latitude=round(lat, 6),
-                    longitude=round(lon, 6),
-                    lanes_north_south=random.choice([2, 3, 4]),
-                    lanes_east_west=random.choice([2, 3, 4]),
-                    has_camera=random.random() < district_config["camera_prob"],
-                    district=district
+
+        # Grid geometry and district bands
+        # (offset from center is approx 0.01 degrees = 1.1 km)
+        I, J = np.meshgrid(
+            np.arange(self.grid_size), np.arange(self.grid_size), indexing='ij'
+        )
+        lat = np.round(lat_base + (I - self.grid_size / 2) * 0.01, 6)
+        lon = np.round(lon_base + (J - self.grid_size / 2) * 0.01, 6)
+        district_idx = np.digitize(np.hypot(I, J), DISTRICT_BOUNDS)
+
+        self.lat_arr = lat.ravel()
+        self.lon_arr = lon.ravel()
+        self.district_idx_arr = district_idx.ravel()
+        self.district_mult_arr = DISTRICT_MULT_ARR[self.district_idx_arr]
+
+        # Per-intersection attributes, drawn for the whole grid at once
+        self.lanes_ns_arr = self.rng.choice([2, 3, 4], size=n).astype(np.int32)
+        self.lanes_ew_arr = self.rng.choice([2, 3, 4], size=n).astype(np.int32)
+        self.has_camera_arr = (
+            self.rng.random(n) < DISTRICT_CAMERA_PROB_ARR[self.district_idx_arr]
+        )
+
+        self.intersection_id_arr = [
+            f"INT-{i:02d}{j:02d}"
+            for i in range(self.grid_size) for j in range(self.grid_size)
+        ]
+        self.name_arr = [
+            f"{chr(65+i)} St & {j+1} Ave"
+            for i in range(self.grid_size) for j in range(self.grid_size)
+        ]
+        self.district_arr = [
+            str(DISTRICT_NAME_ARR[idx]) for idx in self.district_idx_arr
+        ]
+
+    @property
+    def intersections(self) -> List[Intersection]:
+        """Intersection dataclass view of the grid, materialized on demand"""
+        if self._intersections is None:
+            self._intersections = [
+                Intersection(
+                    intersection_id=self.intersection_id_arr[i],
+                    name=self.name_arr[i],
+                    latitude=float(self.lat_arr[i]),
+                    longitude=float(self.lon_arr[i]),
+                    lanes_north_south=int(self.lanes_ns_arr[i]),
+                    lanes_east_west=int(self.lanes_ew_arr[i]),
+                    has_camera=bool(self.has_camera_arr[i]),
+                    district=self.district_arr[i]
                 )
-                intersections.append(intersection)
-        
-        return intersections
+                for i in range(self.grid_size ** 2)
+            ]
+        return self._intersections
 
 class TrafficSimulator:
     """Simulates realistic traffic patterns"""
     def __init__(self, city_grid: CityGrid):
         self.city_grid = city_grid
+        self.rng = np.random.default_rng()
         self.time_of_day_patterns = {
             "night": (0, 6, 0.2),
             "morning_rush": (6, 9, 1.5),
@@ -116,45 +220,35 @@ class TrafficSimulator:
             "evening_rush": (16, 19, 1.6),
             "evening": (19, 24, 0.6)
         }
+        # 24-entry lookup table: hour -> multiplier, so the hot path does a
+        # single index instead of scanning time_of_day_patterns per call
+        self._hour_mult = np.ones(24)
+        for start_hour, end_hour, multiplier in self.time_of_day_patterns.values():
+            self._hour_mult[start_hour:end_hour] = multiplier
+        # Weather impact values and their probabilities (clear/rain/heavy_rain/snow/fog)
+        self.weather_mult_values = np.array([1.0, 0.7, 0.5, 0.4, 0.6])
+        self.weather_mult_weights = np.array([0.6, 0.2, 0.05, 0.05, 0.1])
+        self.signal_states = np.array(["red", "yellow", "green"])
+    def _base_time_multiplier(self, timestamp: datetime) -> float:
+        """Time-of-day multiplier without the random jitter"""
+        return float(self._hour_mult[timestamp.hour])
     def get_traffic_multiplier(self, timestamp: datetime) -> float:
-        hour = timestamp.hour
-        for _, (start_hour, end_hour, multiplier) in self.time_of_day_patterns.items():
-            if start_hour <= hour < end_hour:
-                return multiplier * random.uniform(0.8, 1.2)
-        return 1.0
+        return self._base_time_multiplier(timestamp) * self.rng.uniform(0.8, 1.2)
     def get_weather_impact(self) -> float:
         """Simulate weather impact on traffic"""
         # TODO: In production, this would call a weather API
-        weather_conditions = {
-            "clear": 1.0,
-            "rain": 0.7,
-            "heavy_rain": 0.5,
-            "snow": 0.4,
-            "fog": 0.6
-        }
-
-        condition = random.choices(
-            list(weather_conditions.keys()),
-            weights=[0.6, 0.2, 0.05, 0.05, 0.1],
-        )[0]
-
-        return weather_conditions[condition]
+        return float(self.rng.choice(
+            self.weather_mult_values, p=self.weather_mult_weights
+        ))
     def generate_reading(self, intersection: Intersection, timestamp: datetime) -> TrafficReading:
         """Generate a single traffic reading"""
         base_capacity = (intersection.lanes_north_south + intersection.lanes_east_west) * 10
         time_multiplier = self.get_traffic_multiplier(timestamp)
-        # District multiplier
-        district_multipliers = {
-            "downtown": 1.5,
-            "residential": 0.7,
-            "industrial": 1.2,
-            "suburban": 0.5
-        }
-        district_mult = district_multipliers[intersection.district]
+        district_mult = DISTRICT_MULTIPLIERS[intersection.district]
         weather_mult = self.get_weather_impact()
 
         vehicle_count = int(base_capacity * time_multiplier * district_mult * weather_mult)
-        vehicle_count = max(0, vehicle_count + random.randint(-5, 5))
+        vehicle_count = max(0, vehicle_count + int(self.rng.integers(-5, 6)))
 
         max_capacity = base_capacity * 2
         occupancy_rate = min(1.0, vehicle_count / max_capacity)
@@ -167,21 +261,21 @@ class TrafficSimulator:
         # Vehicle type distribution
         total_vehicles = vehicle_count
         vehicle_types = {
-            "car": int(total_vehicles * random.uniform(0.75, 0.85)),
-            "truck": int(total_vehicles * random.uniform(0.05, 0.12)),
-            "motorcycle": int(total_vehicles * random.uniform(0.02, 0.05)),
-            "bus": int(total_vehicles * random.uniform(0.01, 0.03))
+            "car": int(total_vehicles * self.rng.uniform(0.75, 0.85)),
+            "truck": int(total_vehicles * self.rng.uniform(0.05, 0.12)),
+            "motorcycle": int(total_vehicles * self.rng.uniform(0.02, 0.05)),
+            "bus": int(total_vehicles * self.rng.uniform(0.01, 0.03))
         }
         vehicle_types["car"] = total_vehicles - sum(
             [v for k, v in vehicle_types.items() if k != "car"]
         )
 
         # Wait time and queue length (higher when congested)
-        wait_time = occupancy_rate * random.uniform(30, 120)  # seconds
+        wait_time = occupancy_rate * self.rng.uniform(30, 120)  # seconds
         queue_length = int(occupancy_rate * base_capacity * 0.5)
         
         # Signal state (simplified)
-        signal_state = random.choice(["red", "yellow", "green"])
+        signal_state = str(self.rng.choice(self.signal_states))
         
         return TrafficReading(
             sensor_id=f"{intersection.intersection_id}-SENSOR-01",
@@ -199,34 +293,151 @@ class TrafficSimulator:
             district=intersection.district
         )
 
+    def generate_reading_batch(
+        self, timestamp: datetime
+    ) -> Tuple[List[dict], np.ndarray, np.ndarray, np.ndarray]:
+        """Generate readings for the whole grid in one vectorized pass
+
+        Returns plain dicts ready for JSON serialization, skipping the
+        TrafficReading dataclass and `asdict` deep-copy on the hot path,
+        along with the raw vehicle count, speed and occupancy arrays so
+        callers can compute aggregate stats as C-level reductions.
+        """
+        grid = self.city_grid
+        n = grid.grid_size ** 2
+        rng = self.rng
+
+        base_capacity = (grid.lanes_ns_arr + grid.lanes_ew_arr) * 10
+        time_mult = self._base_time_multiplier(timestamp) * rng.uniform(0.8, 1.2, n)
+        weather_mult = rng.choice(
+            self.weather_mult_values, size=n, p=self.weather_mult_weights
+        )
+        count_noise = rng.integers(-5, 6, n)
+        truck_frac = rng.uniform(0.05, 0.12, n)
+        motorcycle_frac = rng.uniform(0.02, 0.05, n)
+        bus_frac = rng.uniform(0.01, 0.03, n)
+        wait_draw = rng.uniform(30, 120, n)
+        signal_state = rng.choice(self.signal_states, size=n)
+
+        if NUMBA_AVAILABLE:
+            vehicle_count = np.empty(n, dtype=np.int64)
+            occupancy_rate = np.empty(n)
+            average_speed = np.empty(n)
+            cars = np.empty(n, dtype=np.int64)
+            trucks = np.empty(n, dtype=np.int64)
+            motorcycles = np.empty(n, dtype=np.int64)
+            buses = np.empty(n, dtype=np.int64)
+            wait_time = np.empty(n)
+            queue_length = np.empty(n, dtype=np.int64)
+            _compute_batch(
+                base_capacity, grid.district_mult_arr, time_mult, weather_mult,
+                count_noise, truck_frac, motorcycle_frac, bus_frac, wait_draw,
+                vehicle_count, occupancy_rate, average_speed,
+                cars, trucks, motorcycles, buses, wait_time, queue_length
+            )
+        else:
+            vehicle_count = (
+                base_capacity * time_mult * grid.district_mult_arr * weather_mult
+            ).astype(np.int32)
+            vehicle_count = np.maximum(0, vehicle_count + count_noise)
+
+            occupancy_rate = np.minimum(1.0, vehicle_count / (base_capacity * 2))
+            average_speed = np.maximum(5, 35 * (1 - occupancy_rate * 0.7))
+
+            trucks = (vehicle_count * truck_frac).astype(np.int32)
+            motorcycles = (vehicle_count * motorcycle_frac).astype(np.int32)
+            buses = (vehicle_count * bus_frac).astype(np.int32)
+            cars = vehicle_count - trucks - motorcycles - buses
+
+            wait_time = occupancy_rate * wait_draw
+            queue_length = (occupancy_rate * base_capacity * 0.5).astype(np.int32)
+
+        ts = timestamp.isoformat()
+        readings = []
+        for i in range(n):
+            intersection_id = grid.intersection_id_arr[i]
+            readings.append({
+                "sensor_id": f"{intersection_id}-SENSOR-01",
+                "intersection_id": intersection_id,
+                "timestamp": ts,
+                "vehicle_count": int(vehicle_count[i]),
+                "average_speed": round(float(average_speed[i]), 2),
+                "occupancy_rate": round(float(occupancy_rate[i]), 3),
+                "vehicle_types": {
+                    "car": int(cars[i]),
+                    "truck": int(trucks[i]),
+                    "motorcycle": int(motorcycles[i]),
+                    "bus": int(buses[i])
+                },
+                "wait_time_seconds": round(float(wait_time[i]), 1),
+                "queue_length": int(queue_length[i]),
+                "signal_state": str(signal_state[i]),
+                "latitude": float(grid.lat_arr[i]),
+                "longitude": float(grid.lon_arr[i]),
+                "district": grid.district_arr[i]
+            })
+        return readings, vehicle_count, average_speed, occupancy_rate
+
 class EventHubPublisher:
     """Publishes traffic data to Azure Event Hubs"""
+
+    # Headroom per event for AMQP message framing on top of the raw payload
+    EVENT_OVERHEAD_BYTES = 512
+
     def __init__(self, event_hub_conn_string: str, event_hub_name: str):
-        self.producer = EventHubProducerClient.from_connection_string(
-            conn_str=event_hub_conn_string,
-            eventhub_name=event_hub_name
+        self._conn_str = event_hub_conn_string
+        self._hub_name = event_hub_name
+        self.producer = get_producer(
+            event_hub_conn_string, event_hub_name, use_async=True
         )
-    def send_batch(self, readings: List[TrafficReading]):
-        """Send batch of readings to Event Hub"""
-        event_data_batch = self.producer.create_batch()
+    async def send_batch(self, readings: List[dict]):
+        """Send batch of readings to Event Hub, partition-keyed by district
+
+        Readings are bucketed by district so each batch carries a
+        partition_key and downstream consumers can parallelize per
+        district. All batches are sent concurrently.
+        """
+        buckets = defaultdict(list)
+        for reading in readings:
+            buckets[reading["district"]].append(reading)
+
+        batches = []
+        for district, group in buckets.items():
+            batches.extend(await self._pack_batches(group, district))
+
+        await asyncio.gather(*(self.producer.send_batch(b) for b in batches))
+
+    async def _pack_batches(self, readings: List[dict], partition_key: str) -> list:
+        """Pack readings into size-bounded partition-keyed batches
+
+        Packs events by tracking batch size instead of catching ValueError
+        from a full batch, so no exception is raised per batch boundary.
+        """
+        event_data_batch = await self.producer.create_batch(partition_key=partition_key)
+        max_size = event_data_batch.max_size_in_bytes
+        batches = [event_data_batch]
 
         for reading in readings:
-            event_data = EventData(json.dumps(asdict(reading)))
-            try:
-                event_data_batch.add(event_data)
-            except ValueError:
-                # Batch is full, send it and create a new one
-                self.producer.send_batch(event_data_batch)
-                event_data_batch = self.producer.create_batch()
-                event_data_batch.add(event_data)
-
-        if len(event_data_batch) > 0:
-            self.producer.send_batch(event_data_batch)
-    def close(self):
-        """Close the producer"""
-        self.producer.close()
-
-def main():
+            payload = orjson.dumps(reading)
+            projected_size = (
+                event_data_batch.size_in_bytes + len(payload) + self.EVENT_OVERHEAD_BYTES
+            )
+            if len(event_data_batch) > 0 and projected_size > max_size:
+                # Batch is full, start a new one
+                event_data_batch = await self.producer.create_batch(
+                    partition_key=partition_key
+                )
+                batches.append(event_data_batch)
+            event_data_batch.add(EventData(payload))
+
+        return [b for b in batches if len(b) > 0]
+    async def close(self):
+        """Close the producer and evict it from the shared pool"""
+        pending_close = release(self._conn_str, self._hub_name, use_async=True)
+        if pending_close is not None:
+            await pending_close
+
+async def main():
     """
     Main function
     """
@@ -239,11 +450,12 @@ def main():
     )
     simulator = TrafficSimulator(city_grid)
     publisher = EventHubPublisher(CONNECTION_STRING, EVENTHUB_NAME)
+    listener = _setup_logging()
 
-    print(f"🚦 Traffic Simulator Started")
-    print(f"📍 Monitoring {len(city_grid.intersections)} intersections")
-    print(f"📡 Publishing to Event Hub: {EVENTHUB_NAME}")
-    print("-" * 60)
+    logger.info(f"🚦 Traffic Simulator Started")
+    logger.info(f"📍 Monitoring {len(city_grid.intersection_id_arr)} intersections")
+    logger.info(f"📡 Publishing to Event Hub: {EVENTHUB_NAME}")
+    logger.info("-" * 60)
 
     try:
         iteration = 0
@@ -251,33 +463,35 @@ def main():
             iteration += 1
             current_time = datetime.now()
 
-            readings = []
-
-            for intersection in city_grid.intersections:
-                reading = simulator.generate_reading(intersection, current_time)
-                readings.append(reading)
+            readings, vehicle_counts, speeds, occupancies = (
+                simulator.generate_reading_batch(current_time)
+            )
 
-            publisher.send_batch(readings)
+            await publisher.send_batch(readings)
 
-            # Stats
-            total_vehicles = sum(r.vehicle_count for r in readings)
-            avg_speed = sum(r.average_speed for r in readings) / len(readings)
-            avg_occupancy = sum(r.occupancy_rate for r in readings) / len(readings)
+            # Stats (vectorized reductions, no per-reading Python pass);
+            # the isEnabledFor guard skips formatting when INFO is off
+            if logger.isEnabledFor(logging.INFO):
+                total_vehicles = int(vehicle_counts.sum())
+                avg_speed = float(speeds.mean())
+                avg_occupancy = float(occupancies.mean())
 
-            print(f"[{current_time.strftime('%H:%M:%S')}] Iteration {iteration}")
-            print(f"  📊 Total Vehicles: {total_vehicles:,}")
-            print(f"  🚗 Avg Speed: {avg_speed:.1f} mph")
-            print(f"  📈 Avg Occupancy: {avg_occupancy:.1%}")
-            print(f"  ✉️  Events Sent: {len(readings)}")
-            print("-" * 60)
+                logger.info(f"[{current_time.strftime('%H:%M:%S')}] Iteration {iteration}")
+                logger.info(f"  📊 Total Vehicles: {total_vehicles:,}")
+                logger.info(f"  🚗 Avg Speed: {avg_speed:.1f} mph")
+                logger.info(f"  📈 Avg Occupancy: {avg_occupancy:.1%}")
+                logger.info(f"  ✉️  Events Sent: {len(readings)}")
+                logger.info("-" * 60)
 
-            time.sleep(30)
+            await asyncio.sleep(30)
 
-    except KeyboardInterrupt:
-        print("🚦 Traffic Simulator Stopped")
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        # Ctrl+C under asyncio.run arrives as CancelledError at the sleep
+        logger.info("🚦 Traffic Simulator Stopped")
     finally:
-        publisher.close()
-        print("🚦 Traffic Simulator Stopped")
+        await publisher.close()
+        logger.info("🚦 Traffic Simulator Stopped")
+        listener.stop()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -3,14 +3,15 @@ Weather Data Simulator
 Generates weather events that impact traffic
 """
 
-import json
 import time
-import random
+import orjson
+import numpy as np
 from datetime import datetime
-from azure.eventhub import EventHubProducerClient, EventData
-from dataclasses import dataclass, asdict
+from azure.eventhub import EventData
+from dataclasses import dataclass, fields
+from utils.eventhub_pool import get_producer, release
 
-@dataclass
+@dataclass(slots=True)
 class WeatherReading:
     """Weather observation"""
     station_id: str
@@ -24,43 +25,58 @@ class WeatherReading:
     latitude: float
     longitude: float
 
+    def to_dict(self) -> dict:
+        """Flat dict view; skips the recursive deepcopy in dataclasses.asdict"""
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+# Field-name tuple cached once so to_dict is a plain dict build
+WeatherReading._FIELDS = tuple(f.name for f in fields(WeatherReading))
+
 class WeatherSimulator:
     """Simulates weather patterns"""
+    # Condition names and their occurrence probabilities
+    CONDITIONS = ["clear", "cloudy", "rain", "heavy_rain", "snow", "fog"]
+    CONDITION_WEIGHTS = np.array([0.4, 0.3, 0.15, 0.05, 0.05, 0.05])
+
+    # Base values per condition, indexed by condition id (same order as
+    # CONDITIONS), so generate_weather indexes arrays instead of rebuilding
+    # a params dict on every call
+    TEMP_LO = np.array([65, 60, 55, 50, 20, 55])
+    TEMP_HI = np.array([85, 75, 70, 65, 35, 65])
+    HUMIDITY_LO = np.array([0.3, 0.5, 0.7, 0.85, 0.7, 0.9])
+    HUMIDITY_HI = np.array([0.5, 0.7, 0.9, 0.95, 0.9, 1.0])
+    PRECIP = np.array([0, 0, 0.1, 0.5, 0.2, 0])
+    VISIBILITY = np.array([10, 10, 5, 2, 3, 0.5])
+
     def __init__(self, city_center: tuple):
         self.city_center = city_center
-        self.current_condition = "clear"
+        self.rng = np.random.default_rng()
+        self.condition_id = 0  # clear
         self.condition_duration = 0
 
+    @property
+    def current_condition(self) -> str:
+        return self.CONDITIONS[self.condition_id]
+
     def generate_weather(self) -> WeatherReading:
         """Generate a weather reading"""
         if self.condition_duration == 0:
-            self.current_condition = random.choices(
-                ["clear", "cloudy", "rain", "heavy_rain", "snow", "fog"],
-                weights=[0.4, 0.3, 0.15, 0.05, 0.05, 0.05]
-            )[0]
-            self.condition_duration = random.randint(4, 20)  # in intervals
-        
-        self.condition_duration -= 1
-        # Base values by condition
-        condition_params = {
-            "clear": {"temp": (65, 85), "humidity": (0.3, 0.5), "precip": 0, "visibility": 10},
-            "cloudy": {"temp": (60, 75), "humidity": (0.5, 0.7), "precip": 0, "visibility": 10},
-            "rain": {"temp": (55, 70), "humidity": (0.7, 0.9), "precip": 0.1, "visibility": 5},
-            "heavy_rain": {"temp": (50, 65), "humidity": (0.85, 0.95), "precip": 0.5, "visibility": 2},
-            "snow": {"temp": (20, 35), "humidity": (0.7, 0.9), "precip": 0.2, "visibility": 3},
-            "fog": {"temp": (55, 65), "humidity": (0.9, 1.0), "precip": 0, "visibility": 0.5}
-        }
+            self.condition_id = int(
+                self.rng.choice(len(self.CONDITIONS), p=self.CONDITION_WEIGHTS)
+            )
+            self.condition_duration = int(self.rng.integers(4, 21))  # in intervals
 
-        params = condition_params[self.current_condition]
+        self.condition_duration -= 1
+        cid = self.condition_id
 
         return WeatherReading(
             station_id="WEATHER-CENTRAL-01",
             timestamp=datetime.now().isoformat(),
-            temperature_f=round(random.uniform(*params["temp"]), 1),
-            humidity=round(random.uniform(*params["humidity"]), 2),
-            precipitation_rate=params["precip"] * random.uniform(0.8, 1.2),
-            visibility_miles=params["visibility"] * random.uniform(0.9, 1.1),
-            wind_speed_mph=round(random.uniform(0, 25), 1),
+            temperature_f=round(self.rng.uniform(self.TEMP_LO[cid], self.TEMP_HI[cid]), 1),
+            humidity=round(self.rng.uniform(self.HUMIDITY_LO[cid], self.HUMIDITY_HI[cid]), 2),
+            precipitation_rate=float(self.PRECIP[cid]) * self.rng.uniform(0.8, 1.2),
+            visibility_miles=float(self.VISIBILITY[cid]) * self.rng.uniform(0.9, 1.1),
+            wind_speed_mph=round(self.rng.uniform(0, 25), 1),
             condition=self.current_condition,
             latitude=self.city_center[0],
             longitude=self.city_center[1]
@@ -69,11 +85,8 @@ class WeatherSimulator:
 def publish_weather_data(connection_string: str, eventhub_name: str):
     """Publish weather data to Event Hub"""
     
-    producer = EventHubProducerClient.from_connection_string(
-        conn_str=connection_string,
-        eventhub_name=eventhub_name
-    )
-    
+    producer = get_producer(connection_string, eventhub_name)
+
     simulator = WeatherSimulator(city_center=(40.7128, -74.0060))
     
     print("🌤️  Weather Simulator Started")
@@ -86,7 +99,7 @@ def publish_weather_data(connection_string: str, eventhub_name: str):
             weather = simulator.generate_weather()
             
             # Send to Event Hub
-            event_data = EventData(json.dumps(asdict(weather)))
+            event_data = EventData(orjson.dumps(weather.to_dict()))
             producer.send_batch([event_data])
             
             print(f"[{datetime.now().strftime('%H:%M:%S')}] Iteration {iteration}")
@@ -101,7 +114,7 @@ def publish_weather_data(connection_string: str, eventhub_name: str):
     except KeyboardInterrupt:
         print("\n⏹️  Weather simulation stopped")
     finally:
-        producer.close()
+        release(connection_string, eventhub_name)
 
 if __name__ == "__main__":
     CONNECTION_STRING = CONNECTION_STRING = dbutils.secrets.get(scope="smartcity-secrets", key="eventhub-connection-string")
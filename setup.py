@@ -0,0 +1,19 @@
+"""
+setup.py
+Builds the optional Cython extension for the hot validator path
+
+Usage: python setup.py build_ext --inplace
+"""
+
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+# The extension must be named explicitly so build_ext --inplace drops the
+# module inside utils/ and it imports as utils._validator
+setup(
+    name="smartcity-validators",
+    ext_modules=cythonize(
+        [Extension("utils._validator", ["utils/_validator.pyx"])],
+        language_level=3,
+    ),
+)
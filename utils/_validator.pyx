@@ -0,0 +1,42 @@
+# cython: language_level=3
+"""
+utils/_validator.pyx
+Cython fast path for TrafficDataValidator schema validation
+
+Build with: python setup.py build_ext --inplace
+utils/data_validator.py falls back to its generated Python validator when
+this extension isn't built. The field list mirrors
+TrafficDataValidator.REQUIRED_FIELDS; keep the two in sync.
+"""
+
+_MISSING = object()
+
+cdef inline void _check_field(dict m, str field_name, type field_type, list errors):
+    v = m.get(field_name, _MISSING)
+    if v is _MISSING:
+        errors.append("Missing required field: '%s'" % field_name)
+    elif v is None:
+        errors.append("Field '%s' is null" % field_name)
+    elif type(v) is not field_type and not isinstance(v, field_type):
+        errors.append(
+            "Field '%s' has wrong type. Expected %s, got %s"
+            % (field_name, field_type.__name__, type(v).__name__)
+        )
+
+cpdef list validate_schema(dict m):
+    """Validate required fields and data types of a traffic message"""
+    cdef list errors = []
+    _check_field(m, 'sensor_id', str, errors)
+    _check_field(m, 'intersection_id', str, errors)
+    _check_field(m, 'timestamp', str, errors)
+    _check_field(m, 'vehicle_count', int, errors)
+    _check_field(m, 'average_speed', float, errors)
+    _check_field(m, 'occupancy_rate', float, errors)
+    _check_field(m, 'vehicle_types', dict, errors)
+    _check_field(m, 'wait_time_seconds', float, errors)
+    _check_field(m, 'queue_length', int, errors)
+    _check_field(m, 'signal_state', str, errors)
+    _check_field(m, 'latitude', float, errors)
+    _check_field(m, 'longitude', float, errors)
+    _check_field(m, 'district', str, errors)
+    return errors
@@ -6,13 +6,27 @@ Configuration loader with validation and environment variable substitution
 import os
 import yaml
 import re
-from typing import Dict, Any, Optional
+import functools
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml bindings not installed
+    from yaml import SafeLoader as _YamlLoader
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
 class ConfigurationError(Exception):
     """Raised when configuration is invalid"""
     pass
 
+# Matches ${VAR_NAME} placeholders; compiled once instead of per leaf string
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+@functools.lru_cache(maxsize=256)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Split a dotted path once and cache the resulting key tuple"""
+    return tuple(path.split('.'))
+
 class ConfigLoader:
     """Loads and validates YAML configuration"""
     
@@ -28,7 +42,10 @@ class ConfigLoader:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
         self._config = None
+        self._get_cache = {}
         self._environment = os.getenv('ENVIRONMENT', 'dev')
+        self._loaded_mtime_ns = None
+        self._loaded_environment = None
     
     def load(self, environment: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -42,11 +59,19 @@ class ConfigLoader:
         """
         if environment:
             self._environment = environment
-        
-        # Load YAML file
+
+        # Reuse the cached config unless the file changed or the
+        # environment differs from the one it was loaded for
+        mtime_ns = self.config_path.stat().st_mtime_ns
+        if (self._config is not None
+                and mtime_ns == self._loaded_mtime_ns
+                and self._environment == self._loaded_environment):
+            return self._config
+
+        # Load YAML file (CSafeLoader parses ~10x faster than SafeLoader)
         with open(self.config_path, 'r') as f:
-            raw_config = yaml.safe_load(f)
-        
+            raw_config = yaml.load(f, Loader=_YamlLoader)
+
         # Substitute environment variables
         config = self._substitute_env_vars(raw_config)
         
@@ -57,6 +82,9 @@ class ConfigLoader:
         self._validate(merged_config)
         
         self._config = merged_config
+        self._get_cache = {}  # resolved paths are stale after a reload
+        self._loaded_mtime_ns = mtime_ns
+        self._loaded_environment = self._environment
         return merged_config
     
     def _substitute_env_vars(self, config: Dict) -> Dict:
@@ -70,19 +98,15 @@ class ConfigLoader:
         elif isinstance(config, list):
             return [self._substitute_env_vars(item) for item in config]
         elif isinstance(config, str):
-            # Find all ${VAR_NAME} patterns
-            pattern = r'\$\{([^}]+)\}'
-            matches = re.findall(pattern, config)
-            
-            result = config
-            for var_name in matches:
-                env_value = os.getenv(var_name)
+            # Replace all ${VAR_NAME} patterns in a single scan
+            def replace_var(match: re.Match) -> str:
+                env_value = os.getenv(match.group(1))
                 if env_value is None:
-                    print(f"Warning: Environment variable {var_name} not set, using placeholder")
-                    env_value = f"${{{var_name}}}"
-                result = result.replace(f"${{{var_name}}}", env_value)
-            
-            return result
+                    print(f"Warning: Environment variable {match.group(1)} not set, using placeholder")
+                    return match.group(0)
+                return env_value
+
+            return _ENV_VAR_RE.sub(replace_var, config)
         else:
             return config
     
@@ -145,7 +169,7 @@ class ConfigLoader:
     
     def _get_nested_value(self, config: Dict, path: str) -> Any:
         """Get nested dictionary value using dot notation"""
-        keys = path.split('.')
+        keys = _split_path(path)
         value = config
         
         for key in keys:
@@ -171,8 +195,12 @@ class ConfigLoader:
         """
         if self._config is None:
             self.load()
-        
-        value = self._get_nested_value(self._config, path)
+
+        if path in self._get_cache:
+            value = self._get_cache[path]
+        else:
+            value = self._get_nested_value(self._config, path)
+            self._get_cache[path] = value
         return value if value is not None else default
     
     def __getitem__(self, key: str) -> Any:
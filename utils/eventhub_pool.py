@@ -0,0 +1,85 @@
+"""
+utils/eventhub_pool.py
+Shared Event Hub producer clients for the data generators
+
+Each simulator used to open its own AMQP connection; producers are now
+pooled per (connection string, hub name) so connection setup, auth
+handshake and link negotiation happen once per hub.
+"""
+
+import atexit
+import asyncio
+import inspect
+import threading
+from typing import Dict, Tuple
+
+from azure.eventhub import EventHubProducerClient
+from azure.eventhub.aio import EventHubProducerClient as AsyncEventHubProducerClient
+
+_PRODUCERS: Dict[Tuple[str, str, bool], object] = {}
+_LOCK = threading.Lock()
+
+def get_producer(conn_str: str, eventhub_name: str, use_async: bool = False):
+    """
+    Get a shared producer client (lazy singleton per hub)
+
+    Args:
+        conn_str: Event Hub namespace connection string
+        eventhub_name: Target hub name
+        use_async: Return the azure.eventhub.aio client instead of the sync one
+
+    Returns:
+        A cached EventHubProducerClient, created on first request
+    """
+    key = (conn_str, eventhub_name, use_async)
+
+    with _LOCK:
+        producer = _PRODUCERS.get(key)
+        if producer is None:
+            client_cls = (
+                AsyncEventHubProducerClient if use_async else EventHubProducerClient
+            )
+            producer = client_cls.from_connection_string(
+                conn_str=conn_str,
+                eventhub_name=eventhub_name
+            )
+            _PRODUCERS[key] = producer
+
+    return producer
+
+def release(conn_str: str, eventhub_name: str, use_async: bool = False):
+    """
+    Evict a producer from the pool and close it
+
+    Eviction happens before the close so a later get_producer call for the
+    same hub creates a fresh client instead of returning a closed one.
+
+    Returns:
+        The pending close coroutine for async clients (the caller must
+        await it), None otherwise
+    """
+    key = (conn_str, eventhub_name, use_async)
+
+    with _LOCK:
+        producer = _PRODUCERS.pop(key, None)
+
+    if producer is None:
+        return None
+
+    result = producer.close()
+    if inspect.iscoroutine(result):  # async clients return a coroutine
+        return result
+    return None
+
+def close_all():
+    """Close every pooled producer still open (registered atexit)"""
+    with _LOCK:
+        producers = list(_PRODUCERS.values())
+        _PRODUCERS.clear()
+
+    for producer in producers:
+        result = producer.close()
+        if inspect.iscoroutine(result):
+            asyncio.run(result)
+
+atexit.register(close_all)